@@ -0,0 +1,46 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+class PrefetchingJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that loads the user with groups and permissions
+    prefetched, so permission checks in views do not trigger N+1 queries.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                "Token contained no recognizable user identification"
+            )
+
+        try:
+            user = (
+                self.user_model.objects.prefetch_related(
+                    "groups__permissions", "user_permissions"
+                )
+                .only(
+                    "id",
+                    "email",
+                    "is_active",
+                    "is_staff",
+                    "is_superuser",
+                    "password",
+                )
+                .get(**{api_settings.USER_ID_FIELD: user_id})
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        return user
+
+
+class PrefetchingJWTAuthenticationScheme(SimpleJWTScheme):
+    target_class = "accounts.authentication.PrefetchingJWTAuthentication"
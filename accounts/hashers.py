@@ -0,0 +1,12 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher tuned to the OWASP recommended configuration
+    (46 MiB memory, 1 iteration, 1 lane).
+    """
+
+    time_cost = 1
+    memory_cost = 46 * 1024
+    parallelism = 1
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.6 on 2026-08-29 20:23
+
+from datetime import datetime, timezone
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def lowercase_emails(apps, schema_editor):
+    """
+    Lowercase stored emails before the case-insensitive constraint is
+    added; the baseline normalize_email only lowercased the domain. If
+    two rows collide case-insensitively, the most recently logged-in one
+    keeps the address and the others are deactivated with a sentinel
+    email so the constraint can be created.
+    """
+    User = apps.get_model("accounts", "User")
+    by_lower = {}
+    for user in User.objects.order_by("pk").only(
+        "id", "email", "is_active", "last_login"
+    ):
+        by_lower.setdefault(user.email.lower(), []).append(user)
+
+    never = datetime.min.replace(tzinfo=timezone.utc)
+    for lowered, users in by_lower.items():
+        keep = max(users, key=lambda u: (u.last_login or never, -u.pk))
+        for user in users:
+            if user is keep:
+                user.email = lowered
+            else:
+                user.email = f"duplicate.{user.pk}.{lowered}"
+                user.is_active = False
+            user.save(update_fields=["email", "is_active"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_email_lower_idx'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_email_lower_idx',
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.RunPython(
+            lowercase_emails, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_ci_unique'),
+        ),
+    ]
@@ -1,24 +1,48 @@
+from asgiref.sync import sync_to_async
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.core.mail import send_mail
 from config import settings
 
 
 class CustomUserManager(BaseUserManager):
+    def get_by_natural_key(self, email):
+        # Narrow the login SELECT to the columns auth actually needs.
+        return self.only("id", "email", "password", "is_active").get(
+            **{self.model.USERNAME_FIELD: email}
+        )
+
     def create_user(self, email=None, password=None, **extra_fields):
         if not email:
             raise ValueError("Email is required")
-        email = self.normalize_email(email)
+        email = self.normalize_email(email).lower()
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
         return user
 
+    async def acreate_user(self, email=None, password=None, **extra_fields):
+        """
+        Async variant of create_user: the password hash runs in a worker
+        thread and the INSERT goes through the async ORM, so neither
+        blocks the event loop nor touches an unmanaged connection.
+        """
+        if not email:
+            raise ValueError("Email is required")
+        email = self.normalize_email(email).lower()
+        user = self.model(email=email, **extra_fields)
+        await sync_to_async(user.set_password, thread_sensitive=False)(
+            password
+        )
+        await user.asave(using=self._db)
+        return user
+
     def create_superuser(self, email=None, password=None, **extra_fields):
         extra_fields.setdefault("is_staff", True)
         extra_fields.setdefault("is_superuser", True)
@@ -32,6 +56,9 @@ class CustomUserManager(BaseUserManager):
 
 
 class User(AbstractBaseUser, PermissionsMixin):
+    # unique=True provides the B-tree that serves the exact-match
+    # lookups (login, resend); the Lower(email) constraint below guards
+    # against case-variant duplicates.
     email = models.EmailField(unique=True)
     date_joined = models.DateTimeField(default=timezone.now)
     is_staff = models.BooleanField(
@@ -50,6 +77,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     REQUIRED_FIELDS = []
     objects: CustomUserManager = CustomUserManager()  # type: ignore
 
+    class Meta:
+        constraints = [
+            # Case-insensitive uniqueness enforced by the DB; replaces
+            # both the plain unique index and the Lower(email) index.
+            models.UniqueConstraint(
+                Lower("email"), name="user_email_ci_unique"
+            ),
+        ]
+
     def __str__(self):
         return self.email
 
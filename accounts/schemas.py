@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
 from accounts.serializers import (
     ErrorResponseSerializer,
@@ -6,7 +8,9 @@ from accounts.serializers import (
     SignUpSerializer,
 )
 
-signup_schema = {
+# The schema dicts are static after import, so they are frozen with
+# MappingProxyType and share sub-dicts instead of copying them.
+signup_schema = MappingProxyType({
     "auth": None,
     "request": SignUpSerializer,
     "responses": {
@@ -24,8 +28,8 @@ signup_schema = {
         ),
         400: ErrorResponseSerializer,
     },
-}
-confirm_email_schema = {
+})
+confirm_email_schema = MappingProxyType({
     "auth": None,
     "parameters": [
         OpenApiParameter(
@@ -52,22 +56,23 @@ confirm_email_schema = {
         400: ErrorResponseSerializer,
         404: ErrorResponseSerializer,
     },
-}
+})
 
-resend_verification_email_schema = {
-    **confirm_email_schema,
-    "parameters": [
-        OpenApiParameter(
-            name="email",
-            type=str,
-            location=OpenApiParameter.QUERY,  # Changed to QUERY
-            required=True,
-            description="Email",
-        )
-    ],
-}
+# Shares confirm_email_schema's response sub-dicts by reference; only
+# the parameters entry differs.
+_resend_schema = dict(confirm_email_schema)
+_resend_schema["parameters"] = [
+    OpenApiParameter(
+        name="email",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=True,
+        description="Email",
+    )
+]
+resend_verification_email_schema = MappingProxyType(_resend_schema)
 
-login_schema = {
+login_schema = MappingProxyType({
     "request": LoginSerializer,
     "auth": None,
     "responses": {
@@ -120,9 +125,9 @@ login_schema = {
             description="Authentication failed.",
         ),
     },
-}
+})
 
-refresh_token_schema = {
+refresh_token_schema = MappingProxyType({
     "request": RefreshTokenSerializer,
     "responses": {
         200: OpenApiResponse(
@@ -145,4 +150,4 @@ refresh_token_schema = {
             description="Invalid refresh token.",
         ),
     },
-}
+})
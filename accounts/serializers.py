@@ -1,5 +1,7 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import check_password, make_password
+from django.db import IntegrityError
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.exceptions import AuthenticationFailed
 
@@ -8,12 +10,6 @@ from accounts.models import User
 
 class SignUpSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
-        validators=[
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message="Email already exists",
-            )
-        ],
         error_messages={"invalid": "Enter a valid email address."},
     )
     password = serializers.CharField(write_only=True)
@@ -23,40 +19,80 @@ class SignUpSerializer(serializers.ModelSerializer):
         fields = ["email", "password"]
 
     def create(self, validated_data):
-        user = User.objects.create_user(email=validated_data["email"])
-        user.set_password(validated_data["password"])
-        user.save()
-        return user
+        try:
+            return User.objects.create_user(
+                email=validated_data["email"],
+                password=validated_data["password"],
+            )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {"email": "Email already exists"}
+            )
 
 
 class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
 
-    def validate(self, attrs):
-        email = attrs.get("email")
-        password = attrs.get("password")
-
-        if email and password:
-            user = User.objects.filter(email=email).first()
-
-            if not user or not user.check_password(password):
-                raise AuthenticationFailed("Invalid email or password.")
-
-            if not user.is_active:
-                raise AuthenticationFailed(
-                    "Email not verified. Please verify your email."
-                )
-
-            return user
+    async def aauthenticate(self):
+        """
+        Authenticates the validated credentials.
+
+        The user row is fetched with the async ORM and the CPU-bound hash
+        verification runs in a worker thread, so neither blocks the event
+        loop and no ORM code runs outside a managed connection.
+        """
+        # Emails are stored normalized, so reads only need a cheap
+        # strip + lowercase.
+        email = self.validated_data["email"].strip().lower()
+        password = self.validated_data["password"]
+
+        try:
+            user = await User.objects.only(
+                "id", "email", "password", "is_active"
+            ).aget(email=email)
+        except User.DoesNotExist:
+            # Burn a hash so a missing user costs the same as a wrong
+            # password.
+            await sync_to_async(make_password, thread_sensitive=False)(
+                password
+            )
+            raise AuthenticationFailed("Invalid email or password.")
+
+        def verify():
+            rehashed = []
+
+            def setter(raw_password):
+                user.set_password(raw_password)
+                user._password = None
+                rehashed.append(True)
+
+            correct = check_password(password, user.password, setter=setter)
+            return correct, bool(rehashed)
+
+        correct, rehashed = await sync_to_async(
+            verify, thread_sensitive=False
+        )()
+        if not correct:
+            raise AuthenticationFailed("Invalid email or password.")
+        if rehashed:
+            await user.asave(update_fields=["password"])
+
+        if not user.is_active:
+            raise AuthenticationFailed(
+                "Email not verified. Please verify your email."
+            )
 
-        raise AuthenticationFailed("Invalid email or password")
+        return user
 
     def get_tokens(self, user):
         refresh = RefreshToken.for_user(user)
+        # str() signs the token, so serialize each one exactly once.
+        refresh_str = str(refresh)
+        access_str = str(refresh.access_token)
         return {
-            "refresh": str(refresh),
-            "access": str(refresh.access_token),
+            "refresh": refresh_str,
+            "access": access_str,
         }
 
 
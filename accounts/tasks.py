@@ -0,0 +1,33 @@
+from functools import lru_cache
+from smtplib import SMTPException
+
+from celery import shared_task
+from django.conf import settings
+from django.template.loader import get_template
+
+from accounts.models import User
+
+
+@lru_cache(maxsize=None)
+def _verify_template():
+    """Compiled verification email template, loaded once per process."""
+    return get_template("email/verify.html")
+
+
+@shared_task(autoretry_for=(SMTPException,), retry_backoff=True)
+def send_verification_email_task(user_id: int) -> None:
+    """
+    Sends the verification email for a user in a background worker.
+
+    Args:
+        user_id: Primary key of the user to email
+    """
+    from accounts.utils import signer
+
+    user: User = User.objects.get(pk=user_id)
+    token = signer.sign(user.pk)
+    url = f"{settings.PUBLIC_BASE_URL}/api/auth/confirm-email/{token}"
+
+    subject = "Verify your email"
+    html_message = _verify_template().render({"url": url})
+    user.send_email(subject=subject, html_message=html_message)
@@ -1,33 +1,38 @@
+from asgiref.sync import sync_to_async
 from django.core.signing import TimestampSigner
-from django.template.loader import render_to_string
-from rest_framework.request import Request
 from rest_framework.views import Response, exception_handler
 
 from accounts.models import User
+from accounts.tasks import send_verification_email_task
 
 signer = TimestampSigner()
 
 
-def send_verification_email(request: Request, user: User) -> str:
+def send_verification_email(user: User) -> None:
     """
-    Sends verification email to user if the user has a valid email.
+    Queues a verification email for the user in the background worker.
+
+    Only the user id goes into the task payload; the link is built from
+    PUBLIC_BASE_URL, and signing and template rendering happen in the
+    worker.
+
+    Args:
+        user: The user object
+    """
+    send_verification_email_task.delay(user.pk)
+
+
+async def asend_verification_email(user: User) -> None:
+    """
+    Async wrapper around send_verification_email: the broker publish is
+    blocking network I/O, so it runs in a worker thread.
 
     Args:
-        request: The request object
         user: The user object
     """
-    try:
-        token = signer.sign(user.pk)
-        scheme = request.scheme
-        host = request.get_host()
-        url = f"{scheme}://{host}/api/auth/confirm-email/{token}"
-
-        subject = "Verify your email"
-        html_message = render_to_string("email/verify.html", {"url": url})
-        user.send_email(subject=subject, html_message=html_message)
-        return token
-    except Exception as e:
-        raise e
+    await sync_to_async(send_verification_email, thread_sensitive=False)(
+        user
+    )
 
 
 def custom_exception_handler(exc, context):
@@ -1,7 +1,11 @@
+import re
 from typing import Dict
 
-from django.core.signing import BadSignature, SignatureExpired, TimestampSigner
-from django.shortcuts import get_object_or_404
+from adrf.decorators import api_view as async_api_view
+from asgiref.sync import sync_to_async
+from django.core.signing import BadSignature, SignatureExpired
+from django.db import IntegrityError
+from kombu.exceptions import OperationalError
 from drf_spectacular.utils import (
     extend_schema,
 )
@@ -21,58 +25,73 @@ from accounts.schemas import (
     resend_verification_email_schema,
     signup_schema,
 )
-from accounts.serializers import (
-    LoginSerializer,
-    RefreshTokenSerializer,
-    SignUpSerializer,
-)
-from accounts.utils import send_verification_email
+from accounts.serializers import LoginSerializer
+from accounts.utils import asend_verification_email, signer
 from config.settings import TOKEN_EXPIRY
 
-signer = TimestampSigner()
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+MIN_PASSWORD_LENGTH = 8
 
 
 @extend_schema(**signup_schema)
-@api_view(["POST"])
-def signup(request: Request) -> Response:
+@async_api_view(["POST"])
+async def signup(request: Request) -> Response:
     """
     Registers a new user.
 
-    This endpoint validates the provided sign-up data via SignUpSerializer,
-    creates a new user with is_active set to False, and sends a
-    verification email.
+    This endpoint validates the email and password directly against a
+    precompiled pattern, creates a new user with is_active set to False,
+    and queues a verification email in the background worker. The INSERT
+    and password hash run off the event loop.
 
     Returns:
 
         - HTTP 201 with a confirmation token upon successful registration.
-        - HTTP 400 if validation fails or the email verification cannot be
-            sent.
+        - HTTP 400 if validation fails.
     """
-    serializer = SignUpSerializer(data=request.data)
-    if serializer.is_valid():
-        user: User = serializer.save()
-        user.is_active = False
-        user.save()
-        try:
-            send_verification_email(request, user)
-        except Exception as e:
-            user.delete()
-            return Response(
-                {
-                    "message": f"failed to send verification email: {str(e)}",
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        message = {
-            "message": "User created successfully",
-        }
-        return Response(message, status=status.HTTP_201_CREATED)
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    email = request.data.get("email", "")
+    password = request.data.get("password", "")
+
+    errors: Dict[str, list] = {}
+    if not isinstance(email, str) or not _EMAIL_RE.match(email):
+        errors["email"] = ["Enter a valid email address."]
+    if not isinstance(password, str) or len(password) < MIN_PASSWORD_LENGTH:
+        errors["password"] = [
+            f"Password must be at least {MIN_PASSWORD_LENGTH} characters."
+        ]
+    if errors:
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        user: User = await User.objects.acreate_user(
+            email=email, password=password
+        )
+    except IntegrityError:
+        return Response(
+            {"email": ["Email already exists"]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    try:
+        await asend_verification_email(user)
+    except OperationalError:
+        return Response(
+            {
+                "message": (
+                    "User created, but the verification email could not "
+                    "be queued. Request a new one."
+                ),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+    message = {
+        "message": "User created successfully",
+    }
+    return Response(message, status=status.HTTP_201_CREATED)
 
 
 @extend_schema(**confirm_email_schema)
-@api_view(["GET"])
-def confirm_email(request: Request, token: str) -> Response:
+@async_api_view(["GET"])
+async def confirm_email(request: Request, token: str) -> Response:
     """
     Confirms a user's email using a provided token.
 
@@ -91,10 +110,12 @@ def confirm_email(request: Request, token: str) -> Response:
     """
     try:
         user_id: str = signer.unsign(token, max_age=TOKEN_EXPIRY)
-        user: User = get_object_or_404(User, pk=user_id)
+        user: User = await User.objects.only("id", "is_active").aget(
+            pk=user_id
+        )
         if not user.is_active:
             user.is_active = True
-            user.save()
+            await user.asave(update_fields=["is_active"])
             return Response(
                 {"message": "Email verified successfully!"},
                 status=status.HTTP_200_OK,
@@ -119,8 +140,8 @@ def confirm_email(request: Request, token: str) -> Response:
 
 
 @extend_schema(**resend_verification_email_schema)
-@api_view(["GET"])
-def resend_verification_mail(request: Request) -> Response:
+@async_api_view(["GET"])
+async def resend_verification_mail(request: Request) -> Response:
     """
     Resends the verification email to the user.
 
@@ -141,14 +162,23 @@ def resend_verification_mail(request: Request) -> Response:
             status=status.HTTP_400_BAD_REQUEST,
         )
     try:
-        user: User = User.objects.get(email=email)
+        email = email.strip().lower()
+        user: User = await User.objects.only(
+            "id", "email", "is_active"
+        ).aget(email=email)
         if user.is_active:
             return Response(
                 {"message": "Email is already verified."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        send_verification_email(request, user)
+        try:
+            await asend_verification_email(user)
+        except OperationalError:
+            return Response(
+                {"message": "Could not queue the verification email."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
         return Response(
             {
                 "message": "Verification email sent",
@@ -163,14 +193,16 @@ def resend_verification_mail(request: Request) -> Response:
 
 
 @extend_schema(**login_schema)
-@api_view(["POST"])
-def login(request):
+@async_api_view(["POST"])
+async def login(request):
     """
     Authenticate a user and generate access and refresh tokens.
 
     This endpoint validates the provided credentials using LoginSerializer.
-    On successful authentication, it returns a JWT access token and refresh
-    token.
+    The CPU-bound password hash runs off the event loop and the user row
+    is fetched with the async ORM, so neither blocks other requests under
+    ASGI. On successful authentication, it returns a JWT access token and
+    refresh token.
 
     Returns:
 
@@ -179,16 +211,16 @@ def login(request):
         - HTTP 400 if validation errors occur.
     """
     serializer = LoginSerializer(data=request.data)
-    try:
-        if serializer.is_valid():
-            user = serializer.validated_data
-            message: Dict[str, str] = serializer.get_tokens(user)
-            message["message"] = "Login successful"
-            return Response(message, status=status.HTTP_200_OK)
-    except AuthenticationFailed as e:
-        return Response(
-            {"message": str(e)}, status=status.HTTP_401_UNAUTHORIZED
-        )
+    if serializer.is_valid():
+        try:
+            user = await serializer.aauthenticate()
+        except AuthenticationFailed as e:
+            return Response(
+                {"message": str(e)}, status=status.HTTP_401_UNAUTHORIZED
+            )
+        message: Dict[str, str] = serializer.get_tokens(user)
+        message["message"] = "Login successful"
+        return Response(message, status=status.HTTP_200_OK)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -203,26 +235,24 @@ def refresh_token(request):
 
     Returns:
         - HTTP 200 with a new access token.
-        - HTTP 400 if the refresh token is invalid.
+        - HTTP 400 if the refresh token is missing or invalid.
     """
-    serializer = RefreshTokenSerializer(data=request.data)
-
-    if serializer.is_valid():
-        refresh_token = serializer.validated_data["refresh"]  # type: ignore
-
-        try:
-            refresh = RefreshToken(refresh_token)
-            access_token = str(refresh.access_token)
-            return Response(
-                {"access": access_token}, status=status.HTTP_200_OK
-            )
-        except Exception:
-            return Response(
-                {"message": "Invalid refresh token."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    refresh_token = request.data.get("refresh")
+    if not refresh_token:
+        return Response(
+            {"refresh": ["This field is required."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-    return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        refresh = RefreshToken(refresh_token)
+        access_token = str(refresh.access_token)
+        return Response({"access": access_token}, status=status.HTTP_200_OK)
+    except Exception:
+        return Response(
+            {"message": "Invalid refresh token."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
 
 @extend_schema()